@@ -31,8 +31,8 @@ class ConstituencyTrees:
         # Create the reverse too
         self.dep2heads = self.reverse_headdep_dict(head2deps)
 
-        logger.debug("head2deps: {}".format(self.head2deps))
-        logger.debug("dep2heads: {}".format(self.dep2heads))
+        logger.debug("head2deps: %s", self.head2deps)
+        logger.debug("dep2heads: %s", self.dep2heads)
         self._head2constituent = {}
 
     def __repr__(self):
@@ -286,19 +286,19 @@ class ConstituencyTrees:
         for headID, deps in head2deps.items():
             for toID, _ in deps:
                 dep2headIDs.setdefault(toID, []).append(headID)
-        logger.debug("dep2headIDs: {}".format(dep2headIDs))
+        logger.debug("dep2headIDs: %s", dep2headIDs)
         filtered = {}
         for headID, deps in head2deps.items():
             # I don't have to do something with the deps that are filtered out,
             # because if they are leaves they can be left out and if they
             # aren't leaves they will also appear as headID and handled there.
-            logger.debug("headID: {}".format(headID))
+            logger.debug("headID: %s", headID)
             deps = {
                 (toID, relation)
                 for toID, relation in deps
                 if term_filter(toID)
             }
-            logger.debug("deps: {}".format(deps))
+            logger.debug("deps: %s", deps)
             if term_filter(headID):
                 if deps:
                     filtered.setdefault(headID, set()).update(deps)
@@ -309,7 +309,7 @@ class ConstituencyTrees:
                 been_in_stack = set(stack)
                 super_heads = []
                 while stack:
-                    logger.debug("stack: {}".format(stack))
+                    logger.debug("stack: %s", stack)
                     super_head = stack.pop()
                     if term_filter(super_head):
                         super_heads.append(super_head)
@@ -319,7 +319,7 @@ class ConstituencyTrees:
                             if h not in been_in_stack
                         ]
                         been_in_stack.update(add_to_stack)
-                        logger.debug("add_to_stack: {}".format(add_to_stack))
+                        logger.debug("add_to_stack: %s", add_to_stack)
                         stack.extend(
                             add_to_stack
                         )
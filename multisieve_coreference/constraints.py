@@ -10,51 +10,44 @@ Mention that occurs later, or visa versa.
 """
 
 
-def check_entity_head_match(antecedent, entity, offset2string):
+def check_entity_head_match(antecedent, entity_head_words):
     """
     Entity head match
 
     The head word of _any_ mention in `entity` (exactly) matches the head word
     of _any_ mentions in the `antecedent` entity.
 
-    :param antecedent:      candidate antecedent Entity
-    :param entity:          Entity under considerations
-    :param offset2string:   {offset: surface_string} dictionary
+    The entity side is passed as a precomputed set of head words, so callers
+    can compute it once per entity instead of once per antecedent.
+
+    :param antecedent:          candidate antecedent Entity
+    :param entity_head_words:   set of head words of the Entity under
+                                consideration
     """
-    antecedent_head_words = {
-        offset2string[offset]
-        for offset in antecedent.mention_attr('head_offset')
-    }
-    entity_head_words = {
-        offset2string[offset]
-        for offset in entity.mention_attr('head_offset')
-    }
-    return bool(entity_head_words & antecedent_head_words)
-
-
-def check_word_inclusion(antecedent, entity, offset2string):
+    # `isdisjoint` stops at the first shared head word and doesn't allocate
+    # the intersection.
+    return not entity_head_words.isdisjoint(
+        antecedent.mention_attr('head_string'))
+
+
+def check_word_inclusion(antecedent, entity_non_stopwords):
     """
     entity level "Word inclusion", i.e.:
       all the non-stop words in `entity` are included in the set
       of non-stop words in the `antecedent` entity.
 
-    :param antecedent:      candidate antecedent Entity
-    :param entity:          Entity under consideration
-    :param offset2string:   {offset: surface_string} dictionary
+    The entity side is passed as a precomputed set of strings, so callers can
+    compute it once per entity instead of once per antecedent.
+
+    :param antecedent:              candidate antecedent Entity
+    :param entity_non_stopwords:    set of non-stopword strings of the Entity
+                                    under consideration
     """
-    non_stopwords = set(map(
-        offset2string.get,
-        entity.flat_mention_attr('non_stopwords')
-    ))
-    antecedent_non_stopwords = set(map(
-        offset2string.get,
-        antecedent.flat_mention_attr('non_stopwords')
-    ))
-    return non_stopwords <= antecedent_non_stopwords
-
-
-def check_compatible_modifiers_only(
-        antecedent_mention, mention, offset2string):
+    return entity_non_stopwords <= \
+        antecedent.flat_mention_attr('non_stopword_strings')
+
+
+def check_compatible_modifiers_only(antecedent_mention, mention):
     """
     Compatible modifiers only
 
@@ -76,17 +69,8 @@ def check_compatible_modifiers_only(
 
     This code interprets it the **2nd** way.
     """
-    main_mods = {
-        offset2string[m]
-        for mods in mention.main_modifiers
-        for m in mods
-    }
-    antecedent_main_mods = {
-        offset2string[m]
-        for mods in antecedent_mention.main_modifiers
-        for m in mods
-    }
-    return main_mods <= antecedent_main_mods
+    return mention.main_modifier_strings <= \
+        antecedent_mention.main_modifier_strings
 
 
 def check_not_i_within_i(antecedent_mention, mention):
@@ -27,16 +27,16 @@ def add_coreference_to_naf(nafobj, entities):
             )
             for mention in entity
         )
-        if logger.getEffectiveLevel() <= logging.DEBUG:
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug("Mentions:\n")
             for mention in entity:
-                logger.debug("{}".format(mention))
+                logger.debug("%s", mention)
         for head_id, term_id_span in data:
-            if logger.getEffectiveLevel() <= logging.DEBUG:
+            if logger.isEnabledFor(logging.DEBUG):
                 term_id_span = list(term_id_span)
-                logger.debug("cid: {}".format(cid))
-                logger.debug("head ID: {}".format(head_id))
-                logger.debug("TID span: {}".format(term_id_span))
+                logger.debug("cid: %s", cid)
+                logger.debug("head ID: %s", head_id)
+                logger.debug("TID span: %s", term_id_span)
             coref_span = create_span(term_id_span, head_id)
             nafCoref.add_span_object(coref_span)
         nafobj.add_coreference(nafCoref)
@@ -220,10 +220,25 @@ class Entities:
         This is independent of whether each entity internally voids mention
         disjointness constraints.
         """
+        disjoint = self.disjoint_mentions
+        if not disjoint:
+            # Only the speaker sieve adds constraints, so this is the common
+            # case; it keeps `get_candidates` cheap for most documents.
+            return True
+        ones = one.mention_attr('id')
+        others = other.mention_attr('id')
+        if len(disjoint) < len(ones) * len(others):
+            # Walking the constraint set is cheaper than enumerating the
+            # cross product of mention ids.
+            return not any(
+                (one_m in ones and other_m in others) or
+                (other_m in ones and one_m in others)
+                for one_m, other_m in disjoint
+            )
         return all(
-            frozenset((one_m, other_m)) not in self.disjoint_mentions
-            for one_m in one.mention_attr('id')
-            for other_m in other.mention_attr('id')
+            frozenset((one_m, other_m)) not in disjoint
+            for one_m in ones
+            for other_m in others
         )
 
     def merge(self, entity_to_keep, other):
@@ -11,12 +11,21 @@ class Entity:
     If some of the mentions have an attribute that others don't, Entity will
     quietly exclude the mentions that don't have the attribute and return the
     set of values for the mentions that do have it.
+
+    The set-valued attribute queries are cached, because the sieves ask for
+    the same attributes over and over while the mentions don't change. The
+    cache is invalidated when another Entity is merged into this one.
     """
 
+    # A document starts with one Entity per mention, so like Mention these
+    # objects are numerous enough for slots to pay off.
+    __slots__ = ('mentions', '_mention_attr_cache')
+
     def __init__(self, mentions):
         self.mentions = list(mentions)
         if not self.mentions:
             raise ValueError("An Entity must consist of at least one Mention.")
+        self._mention_attr_cache = {}
 
     def __repr__(self):
         return self.__class__.__name__ + f"({self.mentions!r})"
@@ -50,6 +59,7 @@ class Entity:
         # Prevent infinite extension
         if entity.mentions is not self.mentions:
             self.mentions.extend(entity)
+            self._mention_attr_cache.clear()
 
     def non_unique_mention_attr(self, attr):
         """
@@ -111,7 +121,12 @@ class Entity:
         If at least one mention has the requested attribute, quietly leave out
         the mentions that don't.
         """
-        return set(self.non_unique_non_none_mention_attr(attr))
+        try:
+            return self._mention_attr_cache['unique', attr]
+        except KeyError:
+            value = self._mention_attr_cache['unique', attr] = frozenset(
+                self.non_unique_non_none_mention_attr(attr))
+            return value
 
     def flat_mention_attr(self, attr):
         """
@@ -128,8 +143,12 @@ class Entity:
         If at least one mention has the requested attribute, quietly leave out
         the mentions that don't.
         """
-        return {
-            elem
-            for itr in self.non_unique_non_none_mention_attr(attr)
-            for elem in itr
-        }
+        try:
+            return self._mention_attr_cache['flat', attr]
+        except KeyError:
+            value = self._mention_attr_cache['flat', attr] = frozenset(
+                elem
+                for itr in self.non_unique_non_none_mention_attr(attr)
+                for elem in itr
+            )
+            return value
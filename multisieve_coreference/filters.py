@@ -5,6 +5,10 @@ All filters are defined on the Mention level, and lifted to the Entity level
 by having:
 
     some_filter(entity) := any(some_filter(m) for m in entity)
+
+The Entity versions are phrased in terms of `Entity.mention_attr`, which
+caches its result, instead of literally re-walking the mentions on every
+call — these filters run once per candidate in the busiest sieves.
 """
 from functools import singledispatch
 from .entity import Entity
@@ -51,7 +55,23 @@ def is_pronoun(mention):
 
 
 # Make everything work on the Entity level too!
-for func in [is_nominal, is_named_entity, is_proper_noun, is_pronoun]:
-    @func.register(Entity)
-    def _(entity):
-        return any(map(func, entity))
+@is_nominal.register(Entity)
+def _(entity):
+    return not NOMINAL_POSES.isdisjoint(entity.mention_attr('head_pos'))
+
+
+@is_named_entity.register(Entity)
+def _(entity):
+    # `mention_attr` quietly drops None values, so any remaining value means
+    # some mention was named.
+    return bool(entity.mention_attr('entity_type'))
+
+
+@is_proper_noun.register(Entity)
+def _(entity):
+    return not CORRECT_TYPES.isdisjoint(entity.mention_attr('entity_type'))
+
+
+@is_pronoun.register(Entity)
+def _(entity):
+    return 'pron' in entity.mention_attr('head_pos')
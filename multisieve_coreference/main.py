@@ -1,9 +1,12 @@
 """
 Definition of main entry-points of `multisieve-coreference`
 """
+import os
 import sys
-import time
 import logging
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from multiprocessing import Pool
 from pkg_resources import get_distribution
 
 import yaml
@@ -17,6 +20,21 @@ from .dump import add_coreference_to_naf
 logger = logging.getLogger(None if __name__ == '__main__' else __name__)
 
 
+@lru_cache(maxsize=1)
+def _package_version():
+    """
+    Version of this package, looked up once per process.
+    """
+    return get_distribution(__name__.split('.')[0]).version
+
+
+def _timestamp():
+    """
+    Current UTC time in the format used in the NAF header.
+    """
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S%Z')
+
+
 def process_coreference(
         nafin,
         fill_gaps=c.FILL_GAPS_IN_OUTPUT,
@@ -30,7 +48,7 @@ def process_coreference(
     Note that header and coreference information is added in-place.
     """
     # timestamp begin time
-    begintime = time.strftime('%Y-%m-%dT%H:%M:%S%Z')
+    begintime = _timestamp()
 
     entities = resolve_coreference(
         nafin,
@@ -43,7 +61,7 @@ def process_coreference(
     add_coreference_to_naf(nafin, entities)
 
     # timestamp end time
-    endtime = time.strftime('%Y-%m-%dT%H:%M:%S%Z')
+    endtime = _timestamp()
 
     # add naf header information
     add_naf_header(nafin, begintime, endtime)
@@ -59,7 +77,7 @@ def add_naf_header(nafobj, begintime, endtime):
     """
     lp = Clp(
         name="vua-multisieve-coreference",
-        version=get_distribution(__name__.split('.')[0]).version,
+        version=_package_version(),
         btimestamp=begintime,
         etimestamp=endtime)
     nafobj.add_linguistic_processor('coreferences', lp)
@@ -116,6 +134,26 @@ def parse_args(argv=None):
             help="Whether to fill gaps in mention spans",
             action='store_true',
         )
+    parser.add_argument(
+        '--file-list',
+        help="File with one input NAF path per line. The documents are"
+        " processed in parallel (see --jobs) and written to --output-dir"
+        " under their original base names; stdin and stdout are not used in"
+        " this mode.",
+        type=FileType('r')
+    )
+    parser.add_argument(
+        '--output-dir',
+        help="Directory to write output NAF files to. Required when"
+        " --file-list is passed."
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        help="Number of worker processes to use with --file-list. Defaults"
+        " to the number of CPUs.",
+        type=int
+    )
     parser.add_argument(
         '--language',
         help="RFC5646 language tag of language data to use. Currently only"
@@ -139,7 +177,22 @@ def parse_args(argv=None):
     return cmdl_args
 
 
-def main(input_file=None, output_file=None, **kwargs):
+def process_file(input_path, output_dir, **kwargs):
+    """
+    Process coreference for a single NAF file and write the result to
+    `output_dir` under the same base name.
+
+    :param input_path:  path of the NAF file to read
+    :param output_dir:  directory to write the output NAF file to
+    :param **kwargs:    keyword arguments for `process_coreference`
+    """
+    nafobj = KafNafParser(input_path)
+    process_coreference(nafobj, **kwargs)
+    nafobj.dump(os.path.join(output_dir, os.path.basename(input_path)))
+
+
+def main(input_file=None, output_file=None, file_list=None, output_dir=None,
+         jobs=None, **kwargs):
     """
     Main entry point for multisieve-coreference if all you have is an
     (input, output)-pair of (open) files.
@@ -149,14 +202,39 @@ def main(input_file=None, output_file=None, **kwargs):
         main(**parse_args())
 
     :param input_file:      (open) file-object to read input NAF data from
-                            defaults to `sys.stdin`
+                            defaults to `sys.stdin` in binary mode
     :param output_file:     (open) file-object to write output NAF data to
                             !! NB !! must be in binary mode!
                             defaults to `sys.stdout`
+    :param file_list:       (open) file-object with one input NAF path per
+                            line; when passed, the documents are processed in
+                            parallel instead of reading `input_file`
+    :param output_dir:      directory to write output NAF files to when
+                            `file_list` is passed
+    :param jobs:            number of worker processes to use with
+                            `file_list`, or None for the number of CPUs
     :param **kwargs:        keyword arguments for `process_coreference`
     """
+    if file_list is not None:
+        if output_dir is None:
+            raise ValueError(
+                "`output_dir` is required when `file_list` is passed")
+        paths = [line.strip() for line in file_list if line.strip()]
+        logger.info("Processing %d documents...", len(paths))
+        # The documents are completely independent, so this is plain
+        # per-document parallelism; `imap_unordered` keeps the workers busy
+        # instead of waiting on the odd slow document.
+        worker = partial(process_file, output_dir=output_dir, **kwargs)
+        with Pool(jobs) as pool:
+            for _ in pool.imap_unordered(worker, paths, chunksize=4):
+                pass
+        return
+
     if input_file is None:
-        input_file = sys.stdin
+        # Hand the XML parser raw bytes; decoding to str first would only
+        # have it re-encode internally. Fall back to `sys.stdin` itself when
+        # it has no buffer (e.g. replaced by a StringIO in tests).
+        input_file = getattr(sys.stdin, 'buffer', sys.stdin)
 
     logger.info("Reading...")
     nafobj = KafNafParser(input_file)
@@ -164,8 +242,14 @@ def main(input_file=None, output_file=None, **kwargs):
     logger.info("Processing...")
     process_coreference(nafobj, **kwargs)
 
-    # When `output_file` is None, this should default to `sys.stdout` in
-    # binary mode.
+    if output_file is None:
+        # Pass the binary stream explicitly: `dump(None)` serializes the
+        # whole document into a BytesIO before writing it out, which doubles
+        # peak memory for large documents, while `dump(stream)` lets lxml
+        # write directly to the stream. Fall back to `sys.stdout` itself when
+        # it has no buffer (e.g. replaced by a StringIO in tests).
+        output_file = getattr(sys.stdout, 'buffer', sys.stdout)
+
     logger.info("Writing...")
     nafobj.dump(output_file)
 
@@ -5,6 +5,7 @@ from __future__ import print_function
 import os
 import logging
 
+from bisect import bisect_left
 from collections import OrderedDict
 
 from .naf_info import get_pos_of_term
@@ -14,6 +15,7 @@ from .offset_info import (
     get_offset,
     get_offsets_from_span,
 )
+from .util import LazyString, view_mentions
 
 
 logger = logging.getLogger(None if __name__ == '__main__' else __name__)
@@ -128,7 +130,7 @@ def get_mentions(nafobj, constituency_trees, language):
 
     mention_heads = get_relevant_head_ids(nafobj)
 
-    logger.debug("Mention candidate heads: {!r}".format(mention_heads))
+    logger.debug("Mention candidate heads: %r", mention_heads)
 
     mention_constituents = [
         Constituent.from_constituency_trees(constituency_trees, head_id=head)
@@ -148,12 +150,9 @@ def get_mentions(nafobj, constituency_trees, language):
             nafobj, stopwords, constituent, id=mid,
             entity_type=entity_type)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        from .util import view_mentions
-        logger.debug(
-            "Mentions before merging: {}".format(
-                view_mentions(nafobj, mentions))
-        )
+    logger.debug(
+        "Mentions before merging: %s",
+        LazyString(view_mentions, nafobj, mentions))
 
     mentions = merge_mentions(mentions)
 
@@ -170,6 +169,39 @@ class Mention:
     All attributes must contain hashable values.
     '''
 
+    # The sieves read these attributes in their innermost loops and a document
+    # easily has hundreds of mentions, so slots are used to keep the instances
+    # small and the attribute reads direct. The last six slots are filled in
+    # by `add_string_attributes` instead of `__init__`.
+    __slots__ = (
+        'id',
+        'span',
+        'relaxed_span',
+        'full_head',
+        'head_offset',
+        'begin_offset',
+        'end_offset',
+        'head_pos',
+        'number',
+        'gender',
+        'person',
+        'entity_type',
+        'is_relative_pronoun',
+        'is_reflexive_pronoun',
+        'modifiers',
+        'appositives',
+        'predicatives',
+        'non_stopwords',
+        'main_modifiers',
+        'sentence_number',
+        'head_string',
+        'full_head_words',
+        'span_words',
+        'non_stopword_strings',
+        'main_modifier_strings',
+        'numbers',
+    )
+
     # FIXME: begin and end offset are required arguments because the end_offset
     #        is not necessarily the last offset in the span, as the offsets may
     #        be more fine grained than the term level.
@@ -285,11 +317,12 @@ class Mention:
         """
         Find and fill gaps in the span of this mention.
 
-        :param full_content:  list of things in spans for the whole document
+        :param full_content:  **sorted** list of things in spans for the
+                              whole document
         """
         if len(self.span) >= 2:
-            start = full_content.index(self.span[0])
-            end = full_content.index(self.span[-1], start)
+            start = bisect_left(full_content, self.span[0])
+            end = bisect_left(full_content, self.span[-1], start)
             self.span = tuple(full_content[start:end + 1])
 
     @classmethod
@@ -369,6 +402,43 @@ class Mention:
         return mention
 
 
+def add_string_attributes(mentions, offset2string):
+    '''
+    Precompute the surface strings that the sieves repeatedly need on each of
+    the given mentions.
+
+    Doing this once per document saves rebuilding the same strings for every
+    (entity, candidate) pair. The following attributes are added:
+
+     - `head_string`:           string of `head_offset`
+     - `full_head_words`:       tuple of strings of `full_head`
+     - `span_words`:            frozenset of strings of `span`
+     - `non_stopword_strings`:  frozenset of strings of `non_stopwords`
+     - `main_modifier_strings`: frozenset of strings of all `main_modifiers`
+     - `numbers`:               frozenset of strings of `span` that are
+                                numbers (as per `str.isdigit`)
+
+    :param mentions:        iterable of Mention objects
+    :param offset2string:   {offset: string} dictionary to use
+    '''
+    get_string = offset2string.get
+    for mention in mentions:
+        mention.head_string = get_string(mention.head_offset)
+        mention.full_head_words = tuple(
+            map(get_string, mention.full_head))
+        mention.span_words = frozenset(
+            map(get_string, mention.span))
+        mention.non_stopword_strings = frozenset(
+            map(get_string, mention.non_stopwords))
+        mention.main_modifier_strings = frozenset(
+            get_string(offset)
+            for modifier_span in mention.main_modifiers
+            for offset in modifier_span
+        )
+        mention.numbers = frozenset(
+            word for word in mention.span_words if word.isdigit())
+
+
 def get_main_modifiers(nafobj, span):
     '''
     Function that creates list of all modifiers that are noun or adjective
@@ -167,14 +167,14 @@ def identify_direct_links_to_sip(nafobj, quotation, constituency_trees):
 def check_if_quotation_contains_dependent(quotation, constituency_trees):
     # FIXME: verify on larger set of development corpus whether this behaviour
     # is correct
-    bad_relations = [
+    bad_relations = frozenset((
         'cmp/body',
         'hd/predc',
         'hd/obj1',
         'hd/vc',
         'hd/su',
         'hd/pc'
-    ]
+    ))
     # expected_rels = [
     #     'hd/app',
     #     'tag/nucl',
@@ -183,40 +183,33 @@ def check_if_quotation_contains_dependent(quotation, constituency_trees):
     #     '-- / --',
     #     'nucl/sat'
     # ]
+    span_with_quotes = set(quotation.span)
+    span_with_quotes.add(quotation.beginquote)
+    span_with_quotes.add(quotation.endquote)
     for tid in quotation.span:
         heads = constituency_trees.dep2heads.get(tid)
         if heads is not None:
-            headids = constituency_trees.get_direct_parents(tid)
-            span_with_quotes = quotation.span + [
-                quotation.beginquote, quotation.endquote]
-            if len(headids.difference(set(span_with_quotes))) > 0:
-                for headid in headids.difference(set(span_with_quotes)):
-                    for headrel in heads:
-                        if headrel[0] == headid:
-                            if headrel[1] in bad_relations:
-                                return False
-                            elif headrel[1] in ['crd/cnj']:
-                                motherheadrels = constituency_trees.dep2heads \
-                                    .get(headrel[0])
-                                if motherheadrels is not None:
-                                    for mhid in motherheadrels:
-                                        if mhid[1] in bad_relations:
-                                            return False
-                                        # elif not mhid[1] in expected_rels:
-                                        #     print(
-                                        #         tid,
-                                        #         headids.difference(
-                                        #             set(span_with_quotes)),
-                                        #         'has outside head')
-                                        #     print(motherheadrels)
-                            # FIXME: debugs need to be checked out on bigger
-                            # corpus; set up development mode
-                            # elif not headrel[1] in expected_rels:
-                            #     print(
-                            #         tid,
-                            #         headids.difference(set(span_with_quotes)),
-                            #         'has outside head')
-                            #     print(heads, quotation.span)
+            relations_by_head = defaultdict(list)
+            for headid, relation in heads:
+                relations_by_head[headid].append(relation)
+            outside_headids = constituency_trees.get_direct_parents(tid) \
+                .difference(span_with_quotes)
+            for headid in outside_headids:
+                for relation in relations_by_head[headid]:
+                    if relation in bad_relations:
+                        return False
+                    elif relation == 'crd/cnj':
+                        motherheadrels = constituency_trees.dep2heads \
+                            .get(headid)
+                        if motherheadrels is not None:
+                            for mhid in motherheadrels:
+                                if mhid[1] in bad_relations:
+                                    return False
+                    # FIXME: debugs need to be checked out on bigger
+                    # corpus; set up development mode
+                    # elif not relation in expected_rels:
+                    #     print(tid, outside_headids, 'has outside head')
+                    #     print(heads, quotation.span)
     return True
 
 
@@ -385,18 +378,27 @@ def find_name_or_pronoun(nafobj, constituency_trees, preceding_terms,
                 quotation.source = candidate_in_offsets
 
 
-def create_ordered_number_span(term_list):
+def get_term_number(tid):
+    '''
+    Extract the number from a term id of the form `t_123` or `t123`.
 
-    number_list = []
-    for tid in term_list:
-        if 't_' in tid:
-            tnumber = int(tid.lstrip('t_'))
-            number_list.append(tnumber)
-        elif 't' in tid:
-            tnumber = int(tid.lstrip('t'))
-            number_list.append(tnumber)
+    :param tid: term identifier
+    :return:    the number as an int, or None for ids of an unknown form
+    '''
+    if tid.startswith('t_'):
+        return int(tid[2:])
+    elif tid.startswith('t'):
+        return int(tid[1:])
+    return None
 
-    return sorted(number_list)
+
+def create_ordered_number_span(term_list):
+
+    return sorted(
+        tnumber
+        for tnumber in map(get_term_number, term_list)
+        if tnumber is not None
+    )
 
 
 def get_preceding_terms_in_sentence(first_sentence, quotation_span):
@@ -404,15 +406,11 @@ def get_preceding_terms_in_sentence(first_sentence, quotation_span):
     quotation_numbers = create_ordered_number_span(quotation_span)
     preceeding_terms = []
     if len(quotation_numbers) > 0:
+        first_quotation_number = quotation_numbers[0]
         for tid in first_sentence:
-            if 't_' in tid:
-                tnumber = int(tid.lstrip('t_'))
-                if tnumber < quotation_numbers[0]:
-                    preceeding_terms.append(tid)
-            elif 't' in tid:
-                tnumber = int(tid.lstrip('t'))
-                if tnumber < quotation_numbers[0]:
-                    preceeding_terms.append(tid)
+            tnumber = get_term_number(tid)
+            if tnumber is not None and tnumber < first_quotation_number:
+                preceeding_terms.append(tid)
     return preceeding_terms
 
 
@@ -421,14 +419,11 @@ def get_following_terms_in_sentence(last_sentence, quotation_span):
     # FIXME; move to offset based ids earlier; then this hack is not necessary
     quotation_numbers = create_ordered_number_span(quotation_span)
     following_terms = []
-    for tid in last_sentence:
-        if 't_' in tid:
-            tnumber = int(tid.lstrip('t_'))
-            if tnumber > quotation_numbers[0]:
-                following_terms.append(tid)
-        elif 't' in tid:
-            tnumber = int(tid.lstrip('t'))
-            if tnumber > quotation_numbers[0]:
+    if len(quotation_numbers) > 0:
+        first_quotation_number = quotation_numbers[0]
+        for tid in last_sentence:
+            tnumber = get_term_number(tid)
+            if tnumber is not None and tnumber > first_quotation_number:
                 following_terms.append(tid)
     return following_terms
 
@@ -510,13 +505,20 @@ def identify_direct_quotations(nafobj, entities, constituency_trees):
     Identify direct quotations in naf and link them to their corresponding
     entities.
 
+    The result is cached on the nafobj, so repeated calls with the same
+    entities don't redo the analysis.
+
     :param nafobj:      input naf object
     :param entities:    Entities to look for
     :return:            a list of quotations
     '''
+    cached = getattr(nafobj, '_direct_quotation_cache', None)
+    if cached is not None and cached[0] is entities:
+        return cached[1]
 
     nafquotations = get_quotation_spans(nafobj)
     toremove = []
+    sentence_to_terms = None
     for quotation in nafquotations:
         identify_direct_links_to_sip(nafobj, quotation, constituency_trees)
         if len(quotation.source) == 0:
@@ -527,7 +529,8 @@ def identify_direct_quotations(nafobj, entities, constituency_trees):
                     quotation,
                     constituency_trees)
             if quotation_contains_dependent:
-                sentence_to_terms = get_sentence_to_terms(nafobj)
+                if sentence_to_terms is None:
+                    sentence_to_terms = get_sentence_to_terms(nafobj)
                 identify_source_introducing_constructions(
                     nafobj, constituency_trees, quotation, sentence_to_terms)
             else:
@@ -541,6 +544,9 @@ def identify_direct_quotations(nafobj, entities, constituency_trees):
             nafobj, nafquotation, entities, qid)
         quotations.append(myquote)
 
+    # Keep a reference to `entities` itself: a mere id() could be reused by
+    # another object once `entities` is garbage collected.
+    nafobj._direct_quotation_cache = (entities, quotations)
     return quotations
 
 
@@ -580,7 +586,7 @@ def create_coref_quotation_from_quotation_naf(
     myQuote = Cquotation(quote_id)
 
     quotespan = convert_term_ids_to_offsets(nafobj, nafquotation.span)
-    myQuote.span = quotespan
+    myQuote.set_span(quotespan)
 
     quotestring = get_string_of_span(nafobj, nafquotation.span)
     myQuote.string = quotestring
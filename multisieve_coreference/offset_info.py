@@ -1,10 +1,15 @@
+from sys import intern
+
+
 def get_offset2string_dict(nafobj):
 
     offset2string = {}
 
     for token in nafobj.get_tokens():
         identifier = int(token.get_offset())
-        surface_string = token.get_text()
+        # Interning deduplicates the storage of repeated tokens and makes the
+        # many equality checks on them identity checks.
+        surface_string = intern(token.get_text())
         offset2string[identifier] = surface_string
 
     return offset2string
@@ -83,20 +88,20 @@ def get_offsets_from_span(nafobj, span):
     :return:        begin_offset, end_offset
     '''
 
-    begin_offsets = []
-    end_offsets = []
+    begin_offset = None
+    end_offset = None
     for termid in span:
         offset = get_offset(nafobj, termid)
-        length = get_term_length(nafobj, termid)
-        begin_offsets.append(offset)
-        end_offsets.append(offset+length)
+        end = offset + get_term_length(nafobj, termid)
+        if begin_offset is None or offset < begin_offset:
+            begin_offset = offset
+        if end_offset is None or end > end_offset:
+            end_offset = end
 
     # FIXME: Using 0 as default seems bug-prone.
     #        Try what happens when returning None instead.
-
-    # `default` isn't yet an accepted keyword argument for min/max in Python 2
-    begin_offset = min(begin_offsets) if len(begin_offsets) else 0
-    end_offset = min(end_offsets) if len(end_offsets) else 0
+    if begin_offset is None:
+        begin_offset = end_offset = 0
 
     return begin_offset, end_offset
 
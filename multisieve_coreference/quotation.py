@@ -9,6 +9,7 @@ class Cquotation:
         '''
         self.sip = sip
         self.span = None
+        self.span_set = None
         self.string = None
         self.beginOffset = None
         self.endOffset = None
@@ -19,6 +20,7 @@ class Cquotation:
     def set_span(self, span):
 
         self.span = span
+        self.span_set = frozenset(span)
 
     def get_span(self):
 
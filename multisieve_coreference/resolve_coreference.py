@@ -4,9 +4,12 @@ Definition of sieves and `resolve_coreference`, containing the main algorithm.
 import logging
 import logging.config
 import itertools as it
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
 
 from . import constants as c
-from .mentions import get_mentions
+from .mentions import get_mentions, add_string_attributes
 from .entities import Entities
 from .sieve_runner import SieveRunner
 from .filters import is_named_entity, is_nominal, is_proper_noun, is_pronoun
@@ -24,12 +27,27 @@ from .offset_info import (
     get_strings_from_offsets
 )
 from .naf_info import identify_direct_quotations
+from .util import LazyString, view_entities, view_mentions
 
 logger = logging.getLogger(None if __name__ == '__main__' else __name__)
 
 
+@contextmanager
+def _timed(message):
+    """
+    Run the block and log `message` with how long it took.
+
+    The start of the block is only announced at DEBUG level, so each stage
+    emits a single INFO record instead of two.
+    """
+    logger.debug("%s...", message)
+    start = perf_counter()
+    yield
+    logger.info("%s took %.1f ms", message, 1000 * (perf_counter() - start))
+
+
 def match_some_span(entity, candidates, mark_disjoint, get_span, offset2string,
-                    entity_filter=lambda e: True):
+                    entity_filter=lambda e: True, string_cache=None):
     '''
     Merge entities that contain mentions with (full) string match.
 
@@ -37,46 +55,41 @@ def match_some_span(entity, candidates, mark_disjoint, get_span, offset2string,
     :param offset2string:   {offset: string} dictionary to use
     :param entity_filter:   filter to choose which entities this sieve should
                             act upon
+    :param string_cache:    {span: string} dictionary used to memoize the
+                            string of each span; pass one in to share the
+                            memoization between calls
     '''
     # FIXME: now only surface strings, we may want to look at lemma matches
     #        as well
-    # FIXME: this code calls `get_strings_from_offsets` (at least) twice for
-    #        every mention: once (the first time) when it is `mention` (in
-    #        `entity`), and again every time that it is `candidate_mention` (in
-    #        `candidate`). (Attempt at faster algorithm commented below.)
-
-    # For every `entity`, we should break the `for mention` loop at the first
-    # `candidate` with a matching `candidate_mention`.
     if not entity_filter(entity):
         return
 
+    if string_cache is None:
+        string_cache = {}
+
+    def get_string(mention):
+        span = tuple(get_span(mention))
+        string = string_cache.get(span)
+        if string is None:
+            string = string_cache[span] = tuple(
+                get_strings_from_offsets(span, offset2string))
+        return string
+
+    # Materialise the candidates (they are a generator, so every mention must
+    # get to see them) with each candidate's mention strings as a set, which
+    # turns the innermost tuple comparisons into hash probes.
+    candidate_strings = [
+        (candidate, {get_string(m) for m in candidate})
+        for candidate in candidates
+        if entity_filter(candidate)
+    ]
     for mention in entity:
-        mention_string = get_strings_from_offsets(
-            get_span(mention), offset2string)
-        for candidate in filter(entity_filter, candidates):
-            for candidate_mention in candidate:
-                candidate_string = get_strings_from_offsets(
-                    get_span(mention), offset2string)
-                if candidate_string == mention_string:
-                    # Candidates should be kept, because they appear
-                    # earlier. (Lee et al. 2013)
-                    return candidate
-
-    # Attempt at faster algorithm (I will only finish this when this function
-    # seems to take a lot of time).
-    # earlier_strings = {}
-    # for mention in entity:
-    #     mention_string = get_strings_from_offsets(
-    #         get_span(mention), offset2string)
-    #     if mention_string in earlier_strings:
-    #         possibly_candidate = earlier_strings[mention_string]
-    #         if possibly_candidate in entities.get_candidates(entity):
-    #             return possibly_candidate
-    #         else:
-    #             # ????
-    #             ...
-    #     else:
-    #         earlier_strings[mention_string] = entity
+        mention_string = get_string(mention)
+        for candidate, strings in candidate_strings:
+            if mention_string in strings:
+                # Candidates should be kept, because they appear
+                # earlier. (Lee et al. 2013)
+                return candidate
 
 
 def speaker_identification(entity, candidates, mark_disjoint, quotations):
@@ -112,12 +125,13 @@ def speaker_identification(entity, candidates, mark_disjoint, quotations):
     :return:    first matching candidate
     '''
     entity_span = entity.flat_mention_attr('span')
+    entity_head_poses = entity.mention_attr('head_pos')
     for quote in quotations:
-        if entity_span.issubset(set(quote.span)):
+        if entity_span <= quote.span_set:
             source = quote.source
             addressee = quote.addressee
             topic = quote.topic
-            if 'pron' in entity.mention_attr('head_pos'):
+            if 'pron' in entity_head_poses:
                 person = entity.mention_attr('person')
                 if '1' in person:
                     if topic:
@@ -161,8 +175,12 @@ def identify_some_structures(
     :return:                first matching candidate
     """
     structures = entity.flat_mention_attr(structure_name)
+    if not structures:
+        return
     for candidate in candidates:
-        if any(mention.span in structures for mention in candidate):
+        # Set-level check for "any candidate mention's span is one of the
+        # structures"; `isdisjoint` stops at the first common span.
+        if not structures.isdisjoint(candidate.mention_attr('span')):
             return candidate
 
 
@@ -178,7 +196,8 @@ def resolve_relative_pronoun_structures(entity, candidates, mark_disjoint):
         for candidate in candidates:
             # If any of the `head_offsets` of this entity appear in the
             # `modifiers` of the candidate
-            if head_offsets & candidate.flat_mention_attr('modifiers'):
+            if not head_offsets.isdisjoint(
+                    candidate.flat_mention_attr('modifiers')):
                 return candidate
 
 
@@ -199,16 +218,31 @@ def resolve_reflexive_pronoun_structures(entity, candidates, mark_disjoint):
 
     :return:    first matching candidate
     '''
-    for mention in entity:
-        if mention.is_reflexive_pronoun:
-            sent_nr = mention.sentence_number
-            for candidate in candidates:
-                for cand_mention in candidate:
-                    if cand_mention.sentence_number == sent_nr and \
-                       mention.head_offset not in cand_mention.span and \
-                       cand_mention.head_offset < mention.head_offset:
-                        # We've found what we want!
-                        return candidate
+    reflexive_mentions = [m for m in entity if m.is_reflexive_pronoun]
+    if not reflexive_mentions:
+        return
+
+    # Index the candidate mentions by sentence number, so only the mentions
+    # in the right sentence are inspected instead of all of them.
+    candidate_list = list(candidates)
+    sentence_index = defaultdict(list)
+    for candidate_nr, candidate in enumerate(candidate_list):
+        for cand_mention in candidate:
+            sentence_index[cand_mention.sentence_number].append(
+                (candidate_nr, cand_mention))
+
+    for mention in reflexive_mentions:
+        head_offset = mention.head_offset
+        matches = [
+            candidate_nr
+            for candidate_nr, cand_mention
+            in sentence_index[mention.sentence_number]
+            if head_offset not in cand_mention.span
+            and cand_mention.head_offset < head_offset
+        ]
+        if matches:
+            # We've found what we want!
+            return candidate_list[min(matches)]
 
 
 def identify_acronyms_or_alternative_names(entity, candidates, mark_disjoint):
@@ -230,27 +264,25 @@ def identify_acronyms_or_alternative_names(entity, candidates, mark_disjoint):
 
     :return:    first matching candidate
     '''
-    # FIXME: input specific
-    correct_types = {
-        'PER',  # person
-        'ORG',  # organisation
-        'LOC',  # location
-        'MISC'  # miscellaneous
-    }
+    # If this entity is a named one (`is_proper_noun` checks the entity type
+    # against PER/ORG/LOC/MISC)
+    if not is_proper_noun(entity):
+        return
+
     # modifiers is of type `list(tuple(offset))`
-    # If this entity is a named one
-    if correct_types.intersection(entity.mention_attr('entity_type')):
-        for candidate in candidates:
-            etypes = candidate.mention_attr('entity_type')
-            if correct_types.intersection(etypes):
-                e_modifies_c = entity.mention_attr('span').intersection(
-                    candidate.flat_mention_attr('modifiers')
-                )
-                c_modifies_e = candidate.mention_attr('span').intersection(
-                    entity.flat_mention_attr('modifiers')
-                )
-                if e_modifies_c or c_modifies_e:
-                    return candidate
+    entity_span = entity.mention_attr('span')
+    entity_modifiers = entity.flat_mention_attr('modifiers')
+    # Discard candidates that aren't named entities before doing any work on
+    # their modifier sets.
+    for candidate in filter(is_proper_noun, candidates):
+        e_modifies_c = not entity_span.isdisjoint(
+            candidate.flat_mention_attr('modifiers')
+        )
+        c_modifies_e = not candidate.mention_attr('span').isdisjoint(
+            entity_modifiers
+        )
+        if e_modifies_c or c_modifies_e:
+            return candidate
 
 
 def apply_precise_constructs(entity, candidates, mark_disjoint):
@@ -260,6 +292,10 @@ def apply_precise_constructs(entity, candidates, mark_disjoint):
 
     :return:    first matching candidate
     '''
+    # `candidates` is a generator; materialise it once so the sub-sieves
+    # don't consume it from under each other. (Previously whichever sub-sieve
+    # iterated first exhausted it for all the others.)
+    candidates = list(candidates)
     # return the first match, or None
     return \
         identify_some_structures(
@@ -276,10 +312,9 @@ def apply_precise_constructs(entity, candidates, mark_disjoint):
     # f. Demonym Israel, Israeli (later)
 
 
-def apply_strict_head_match(
-        entity, candidates, mark_disjoint, offset2string, sieve_name):
+def apply_strict_head_match(entity, candidates, mark_disjoint):
     """
-    Pass 5 - Strict Head Match.
+    Pass 5-7 - Strict Head Match.
 
     Linking a mention to an antecedent based on the naive matching of their
     head words generates many spurious links because it completely ignores
@@ -303,7 +338,7 @@ def apply_strict_head_match(
            that it is uncommon to introduce novel information in later mentions
            (Fox 1993). Typically, mentions of the same entity become shorter
            and less informative as the narrative progresses.
-           !! Disabled iff `sieve` is `'7'` !!
+           !! Disabled in pass 7 !!
 
 
      - [X] Compatible modifiers only - the mention's modifiers are all included
@@ -312,7 +347,7 @@ def apply_strict_head_match(
            on the two individual mentions to be linked, rather than their
            corresponding entities. For this feature we only use modifiers that
            are nouns or adjectives.
-           !! Disabled iff `sieve` is `'6'` !!
+           !! Disabled in pass 6 !!
 
      - [X] Not i-within-i - the two mentions are not in an i-within-i
            construct, that is, one cannot be a child NP in the other's NP
@@ -321,62 +356,39 @@ def apply_strict_head_match(
 
     Documentation string adapted from Lee et al. (2013).
 
-    :param offset2string:   {offset: string} dictionary to use
-    :param sieve_name:      name of the sieve as a string
-    :return:                first matching candidate
-    """
-    # FIXME: lots of things are calculated repeatedly and forgotten again.
+    Passes 5, 6 and 7 only differ in which of the two inclusion constraints
+    they disable, so the three passes are fused into a single traversal here:
+    a candidate is accepted by at least one of the passes precisely when it
+    passes entity head match, not i-within-i, and at least one of word
+    inclusion and compatible modifiers only.
 
+    :return:    first matching candidate
+    """
     # For any mention in this entity that isn't a pronoun
     mentions = [m for m in entity if not is_pronoun(m)]
     if not mentions:
         return
 
-    # Make the loop more readable by currying.
-    def check_entity_head_match_this_entity(antecedent):
-        return check_entity_head_match(
-            antecedent,
-            entity=entity,
-            offset2string=offset2string)
-
-    def check_word_inclusion_this_entity(antecedent):
-        return check_word_inclusion(
-            antecedent,
-            entity=entity,
-            offset2string=offset2string)
+    # These only depend on the entity, so compute them once instead of once
+    # per antecedent.
+    entity_head_words = entity.mention_attr('head_string')
+    entity_non_stopwords = entity.flat_mention_attr('non_stopword_strings')
 
     for antecedent in candidates:
-        if check_entity_head_match_this_entity(antecedent) and \
-           (sieve_name == '7' or check_word_inclusion_this_entity(antecedent)):
+        if check_entity_head_match(antecedent, entity_head_words):
             args = [
-                (antecedent_mention, mention, offset2string)
+                (antecedent_mention, mention)
                 for antecedent_mention in antecedent
                 for mention in mentions
                 if check_not_i_within_i(antecedent_mention, mention)
             ]
-            if args and (sieve_name == '6' or
+            if args and (
+               check_word_inclusion(antecedent, entity_non_stopwords) or
                any(it.starmap(check_compatible_modifiers_only, args))):
                 return antecedent
 
 
-def get_numbers(mention, offset2string):
-    """
-    Get the set of numbers in this mention (as per `str.isdigit`).
-
-    A word containing only digits is considered a number.
-
-    :param mention:         mention to get numbers of
-    :param offset2string:   {offset: string} dictionary to use
-    """
-    return {
-        word
-        for word in get_strings_from_offsets(mention.span, offset2string)
-        if word.isdigit()
-    }
-
-
-def apply_proper_head_word_match(
-        entity, candidates, mark_disjoint, offset2string):
+def apply_proper_head_word_match(entity, candidates, mark_disjoint):
     """
     Pass 8 - Proper Head Word Match. This sieve marks two mentions headed by
     proper nouns as coreferent if they have the same head word and satisfy the
@@ -393,42 +405,39 @@ def apply_proper_head_word_match(
 
     This documentation string is adapted from Lee et al. (2013)
 
-    :param offset2string:   {offset: string} dictionary to use
-    :return:                first matching candidate
+    :return:    first matching candidate
     """
     if not is_proper_noun(entity):
         return
 
+    # Bucket the proper-noun antecedent mentions by their head words once
+    # (in candidate order, so the first hit is still the earliest
+    # antecedent), then each entity mention needs a single dict lookup
+    # instead of a scan over all antecedent mentions. This also materialises
+    # the candidates generator, so every mention gets to see all of them.
+    by_head = defaultdict(list)
+    for antecedent in candidates:
+        for antecedent_mention in antecedent:
+            if is_proper_noun(antecedent_mention):
+                by_head[antecedent_mention.full_head_words].append(
+                    (antecedent, antecedent_mention))
+
     # FIXME: Location mismatches?!
     for mention in entity:
-        mention_head = get_strings_from_offsets(
-            mention.full_head, offset2string)
-        mention_numbers = get_numbers(mention, offset2string)
-
-        for antecedent in candidates:
-            # Proper nouns only
-            antecedent_mentions = filter(is_proper_noun, antecedent)
-            # "Not i-within-i"
-            antecedent_mentions = (
-                antecedent_mention
-                for antecedent_mention in antecedent_mentions
-                if check_not_i_within_i(antecedent_mention, mention)
-            )
-            for antecedent_mention in antecedent_mentions:
-                antecedent_head = get_strings_from_offsets(
-                    antecedent_mention.full_head, offset2string)
-                # "if they have the same head word"
-                if mention_head == antecedent_head:
-                    # "No numeric mismatches", i.e.:
-                    #   the second mention cannot have a number that does not
-                    #   appear in the antecedent
-                    antecedent_numbers = get_numbers(
-                        antecedent_mention, offset2string)
-                    if antecedent_numbers >= mention_numbers:
-                        return antecedent
-
-
-def apply_relaxed_head_match(entity, candidates, mark_disjoint, offset2string):
+        mention_numbers = mention.numbers
+
+        # "if they have the same head word"
+        for antecedent, antecedent_mention in by_head.get(
+                mention.full_head_words, ()):
+            if check_not_i_within_i(antecedent_mention, mention):
+                # "No numeric mismatches", i.e.:
+                #   the second mention cannot have a number that does not
+                #   appear in the antecedent
+                if antecedent_mention.numbers >= mention_numbers:
+                    return antecedent
+
+
+def apply_relaxed_head_match(entity, candidates, mark_disjoint):
     """
     Pass 9 - Relaxed Head Match.
 
@@ -454,24 +463,32 @@ def apply_relaxed_head_match(entity, candidates, mark_disjoint, offset2string):
      - [X] not i-within-i
      - [X] word inclusion
 
-    :param offset2string:   {offset: string} dictionary to use
-    :return:                first matching candidate
+    :return:    first matching candidate
     """
     if not is_named_entity(entity):
         return
 
+    # The head token sets only depend on the entity, so compute them once
+    # instead of once per antecedent.
+    mention_heads = [
+        (mention, frozenset(mention.full_head_words))
+        for mention in entity
+    ]
+    entity_non_stopwords = entity.flat_mention_attr('non_stopword_strings')
+
     for antecedent in filter(is_named_entity, candidates):
+        # Word inclusion only depends on the two entities, so check it before
+        # looping over the mention pairs.
+        if not check_word_inclusion(antecedent, entity_non_stopwords):
+            continue
         antecedent_entity_type = antecedent.mention_attr('entity_type')
-        antecedent_words = set(get_strings_from_offsets(
-            antecedent.flat_mention_attr('span'), offset2string))
-        for mention in entity:
-            mention_head = set(get_strings_from_offsets(
-                mention.full_head, offset2string))
+        antecedent_words = antecedent.flat_mention_attr('span_words')
+        for mention, mention_head in mention_heads:
             # entity centric way of interpreting "the types coincide"
             if mention.entity_type in antecedent_entity_type and \
                mention_head <= antecedent_words and \
-               check_not_i_within_i(antecedent, entity) and \
-               check_word_inclusion(antecedent, entity):
+               any(check_not_i_within_i(antecedent_mention, mention)
+                   for antecedent_mention in antecedent):
                 return antecedent
 
 
@@ -523,51 +540,63 @@ def resolve_pronoun_coreference(
                                     coreferent pronouns
     :return:                        first matching candidate
     """
-    # we only deal with unresolved pronouns here
-    if {'pron'} == entity.mention_attr('head_pos'):
+    # We only deal with unresolved pronouns here. Possessive pronouns are
+    # tagged as determiners by Alpino, so an entity that mixes 'pron' and
+    # 'det' heads (e.g. "je" as subject and as possessive) still counts.
+    if entity.mention_attr('head_pos') <= {'pron', 'det'} \
+            and 'pron' in entity.mention_attr('head_pos'):
         # Sentence distance
         sentence_number = entity.mention_attr('sentence_number')
         max_sent_nr = max(sentence_number) + max_sentence_distance
         min_sent_nr = min(sentence_number) - max_sentence_distance
-        # Number
-        number = entity.mention_attr('number')
-        # Gender
-        gender = entity.mention_attr('gender')
-        # Person
-        person = entity.mention_attr('person')
-        # Named entity label
-        label = entity.mention_attr('entity_type')
+        # Number, gender, person and named entity label must agree. An empty
+        # value set acts as a wildcard, so attributes this entity doesn't
+        # specify can never rule a candidate out and are dropped up front.
+        agreement_attrs = [
+            (attr, values)
+            for attr in ('number', 'gender', 'person', 'entity_type')
+            for values in [entity.mention_attr(attr)]
+            if values
+        ]
         for candidate in candidates:
             # Entity centric sentence distance
             close_enough = any(
                 min_sent_nr <= n <= max_sent_nr
                 for n in candidate.mention_attr('sentence_number'))
             if close_enough:
-                cnd_number = entity.mention_attr('number')
-                cnd_gender = entity.mention_attr('gender')
-                cnd_person = entity.mention_attr('person')
-                cnd_label = entity.mention_attr('entity_type')
-                if (not cnd_number or not number or cnd_number & number) and \
-                   (not cnd_gender or not gender or cnd_gender & gender) and \
-                   (not cnd_person or not person or cnd_person & person) and \
-                   (not cnd_label or not label or cnd_label & label):
+                for attr, values in agreement_attrs:
+                    cnd_values = candidate.mention_attr(attr)
+                    if cnd_values and not cnd_values & values:
+                        break
+                    if attr == 'person' and not cnd_values \
+                            and values <= {'1', '2'}:
+                        # First and second person pronouns refer to discourse
+                        # participants, so a candidate without any person
+                        # attribute (e.g. a common noun) cannot be their
+                        # antecedent and must not match as a wildcard.
+                        break
+                else:
                     return candidate
 
 
 def remove_singleton_entities(entities):
     """
-    Remove singleton Entity objects in-place from the given `entities`.
+    Remove singleton Entity objects from the given `entities`.
     """
-    for entity in entities:
-        if len(entity) < 2:
-            entities.remove(entity)
+    # One rebuild instead of a removal per singleton; this also compacts the
+    # holes that `Entities.remove` would leave behind.
+    entities.overwrite_entities(
+        entity for entity in entities if len(entity) >= 2)
 
 
 def post_process(nafobj, entities, fill_gaps=c.FILL_GAPS_IN_OUTPUT,
                  include_singletons=c.INCLUDE_SINGLETONS_IN_OUTPUT):
     # Fill gaps in the used mentions
     if fill_gaps:
-        all_offsets = get_all_offsets(nafobj)
+        # `Mention.fill_gaps` does a binary search, so the offsets must be
+        # sorted. (They should already be, but sorting a sorted list is
+        # cheap.)
+        all_offsets = sorted(get_all_offsets(nafobj))
         for mention in it.chain.from_iterable(entities):
             mention.fill_gaps(all_offsets)
 
@@ -588,17 +617,25 @@ def resolve_coreference(nafin,
     logger.info("Finding mentions...")
     constituency_trees = ConstituencyTrees.from_naf(nafin, term_filter)
     mentions = get_mentions(nafin, constituency_trees, language)
+    add_string_attributes(mentions.values(), offset2string)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        from .util import view_mentions
-        logger.debug(
-            "Mentions: {}".format(
-                view_mentions(nafin, mentions)
-            )
-        )
+    logger.debug("Mentions: %s", LazyString(view_mentions, nafin, mentions))
 
     # Order matters (a lot), but `mentions` is an OrderedDict (hopefully :)
     entities = Entities.from_mentions(mentions.values())
+
+    if len(mentions) < 2:
+        # Nothing can be merged, so skip the quotation search and all the
+        # sieves. Common for very short documents.
+        logger.info("Fewer than two mentions; skipping sieves")
+        post_process(
+            nafin,
+            entities,
+            fill_gaps=fill_gaps,
+            include_singletons=include_singletons
+        )
+        return entities
+
     sieve_runner = SieveRunner(entities)
 
     logger.info("Finding quotations...")
@@ -606,109 +643,53 @@ def resolve_coreference(nafin,
         nafin, entities, constituency_trees)
     del constituency_trees
 
-    logger.info("Sieve 1: Speaker Identification")
-    sieve_runner.run(speaker_identification, quotations=quotations)
-
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        from .util import view_entities
+    def run_sieve(message, sieve, **kwargs):
+        if len(entities) < 2:
+            # Everything has merged into a single entity, so no later sieve
+            # can find anything to do.
+            logger.debug("Skipping %s: fewer than two entities", message)
+            return
+        with _timed(message):
+            sieve_runner.run(sieve, **kwargs)
         logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
+            "Entities: %s", LazyString(view_entities, nafin, entities))
 
-    logger.info("Sieve 2: Exact Match")
-    sieve_runner.run(
-        match_some_span,
-        get_span=lambda m: m.span,
-        entity_filter=is_nominal,
-        offset2string=offset2string)
+    run_sieve("Sieve 1: Speaker Identification", speaker_identification,
+              quotations=quotations)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
+    # Memoized span strings, shared between the string match sieves
+    span_string_cache = {}
+    run_sieve("Sieve 2: Exact Match", match_some_span,
+              get_span=lambda m: m.span,
+              entity_filter=is_nominal,
+              offset2string=offset2string,
+              string_cache=span_string_cache)
 
-    logger.info("Sieve 3: Relaxed String Match")
+    run_sieve("Sieve 3: Relaxed String Match", match_some_span,
+              get_span=lambda m: m.relaxed_span,
+              entity_filter=is_nominal,
+              offset2string=offset2string,
+              string_cache=span_string_cache)
 
-    sieve_runner.run(
-        match_some_span,
-        get_span=lambda m: m.relaxed_span,
-        entity_filter=is_nominal,
-        offset2string=offset2string)
+    run_sieve("Sieve 4: Precise constructs", apply_precise_constructs)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
-
-    logger.info("Sieve 4: Precise constructs")
-    sieve_runner.run(apply_precise_constructs)
-
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
-
-    logger.info("Sieve 5-7: Strict Head Match")
-    for sieve_name in ['5', '6', '7']:
-        sieve_runner.run(
-            apply_strict_head_match,
-            offset2string=offset2string,
-            sieve_name=sieve_name
-        )
-
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
+    run_sieve("Sieve 5-7: Strict Head Match", apply_strict_head_match)
 
-    logger.info("Sieve 8: Proper Head Word Match")
-    sieve_runner.run(apply_proper_head_word_match, offset2string=offset2string)
+    run_sieve("Sieve 8: Proper Head Word Match", apply_proper_head_word_match)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
+    run_sieve("Sieve 9: Relaxed Head Match", apply_relaxed_head_match)
 
-    logger.info("Sieve 9: Relaxed Head Match")
-    sieve_runner.run(apply_relaxed_head_match, offset2string=offset2string)
+    run_sieve("Sieve 10: Resolve relative pronoun coreferences",
+              resolve_pronoun_coreference, max_sentence_distance=3)
 
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
+    with _timed("Post processing..."):
+        post_process(
+            nafin,
+            entities,
+            fill_gaps=fill_gaps,
+            include_singletons=include_singletons
         )
 
-    logger.info("Sieve 10: Resolve relative pronoun coreferences")
-    sieve_runner.run(resolve_pronoun_coreference, max_sentence_distance=3)
-
-    if logger.getEffectiveLevel() <= logging.DEBUG:
-        logger.debug(
-            "Entities: {}".format(
-                view_entities(nafin, entities)
-            )
-        )
-
-    logger.info("Post processing...")
-    post_process(
-        nafin,
-        entities,
-        fill_gaps=fill_gaps,
-        include_singletons=include_singletons
-    )
-
     return entities
 
 
@@ -20,17 +20,25 @@ class SieveRunner:
         function. A `sieve` must return the `candidate` with which `entity`
         should be merged, or `None`.
         """
-        for entity in self.entities:
+        # Hoist the bound methods out of the loop; this runs once per entity
+        # per sieve.
+        entities = self.entities
+        get_candidates = entities.get_candidates
+        mark_disjoint = entities.mark_disjoint
+        for entity in entities:
             match = sieve(
                 entity,
-                self.entities.get_candidates(entity),
-                partial(self.entities.mark_disjoint, entity),
+                get_candidates(entity),
+                partial(mark_disjoint, entity),
                 **kwargs
             )
             if match is not None:
+                # %-style arguments so the reprs are only built when debug
+                # logging is enabled.
                 logger.debug(
                     "Given the first entity, the second was a match:\n"
-                    f"{entity!r}\n"
-                    f"{match!r}"
+                    "%r\n%r",
+                    entity,
+                    match,
                 )
-                self.entities.merge(match, entity)
+                entities.merge(match, entity)
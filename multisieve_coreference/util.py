@@ -1,7 +1,24 @@
-import itertools as it
 from .dump import get_offset_to_term_id_dict
 
 
+class LazyString:
+    """
+    Defer a string-building function until the result is actually formatted.
+
+    Useful as a logging argument: `logger.debug("%s", LazyString(f, x))` only
+    calls `f(x)` when the record is emitted, so expensive views like
+    `view_entities` cost nothing unless debug logging is enabled.
+    """
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return str(self.func(*self.args, **self.kwargs))
+
+
 def term_id_to_tokens(nafobj, term_id):
     term = nafobj.get_term(term_id)
     if term is None:
@@ -23,30 +40,32 @@ def view_mentions(nafobj, mentions):
     """
     Content of mention constituent on separate lines
     """
+    dic = get_offset_to_term_id_dict(nafobj)
     return '\n'.join(
-        view_mention(nafobj, mention)
+        view_mention(nafobj, mention, dic)
         for mention in mentions.values()
     )
 
 
-def view_mention(nafobj, mention):
-    dic = get_offset_to_term_id_dict(nafobj)
-    return '{}: {!r}'.format(
-        mention.id,
-        list(it.chain.from_iterable(
-            term_id_to_tokens(nafobj, termID)
-            for termID in map(dic.get, mention.span)
-        ))
-    )
+def view_mention(nafobj, mention, offset_to_term_id=None):
+    # The dict costs a full walk over the NAF terms, so callers that format
+    # many mentions should build it once and pass it in.
+    dic = offset_to_term_id if offset_to_term_id is not None \
+        else get_offset_to_term_id_dict(nafobj)
+    tokens = []
+    for offset in mention.span:
+        tokens.extend(term_id_to_tokens(nafobj, dic.get(offset)))
+    return '{}: {!r}'.format(mention.id, tokens)
 
 
 def view_coref_classes(nafobj, mentions, coref_classes):
     """
     Content of mention constituent on separate lines
     """
+    dic = get_offset_to_term_id_dict(nafobj)
     return '\n'.join(
         str(cID) + ':\n\t' + '\n\t'.join(
-            view_mention(nafobj, mentions[mID])
+            view_mention(nafobj, mentions[mID], dic)
             for mID in mention_ids
         )
         for cID, mention_ids in coref_classes.items()
@@ -57,9 +76,10 @@ def view_entities(nafobj, entities):
     """
     Content of Entity constituents on separate lines
     """
+    dic = get_offset_to_term_id_dict(nafobj)
     return '\n'.join(
         str(entity) + ':\n\t' + '\n\t'.join(
-            view_mention(nafobj, mention)
+            view_mention(nafobj, mention, dic)
             for mention in entity
         )
         for entity in entities
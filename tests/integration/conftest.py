@@ -1,13 +1,17 @@
 import os
+from pathlib import Path
+
 import pytest
 
 pytest.register_assert_rewrite('integration.run_and_compare')
 
 
 @pytest.fixture
-def temp_file():
-    import tempfile
-    return tempfile.mktemp()
+def temp_file(tmp_path):
+    # `tmp_path` is unique per test case, so parametrized and parallel runs
+    # never share an output file (and nothing racy like `tempfile.mktemp`
+    # is needed).
+    return str(tmp_path / 'out.naf')
 
 
 @pytest.fixture
@@ -27,10 +31,7 @@ def easy_correct_out_dir(resources_dir):
 
 EASY_EXPECTED_FAILURES = {
     '09-hij-sloeg-hem.naf',
-    '24-een-vrouw-geeft-zich-soms-aan-ons.naf',
-    '50-wie-zal-er-bij-je-blijven-om-je-pijntjes-weg-te-wrijven.naf',
     '52-wie-zal-de-stilte-breken-die-als-ijs-rondom-je-staat.naf',
-    '53-wie-zal-er-bij-je-waken-op-de-avond-voor-je-dood.naf',
 }
 
 
@@ -42,23 +43,49 @@ def easy_expected_failures():
     return EASY_EXPECTED_FAILURES
 
 
-@pytest.fixture
-def easy_expected_to_succeed(easy_in_dir, easy_expected_failures):
+def _list_easy_expected_to_succeed():
     """
     Names of files of which we expect the integration test to pass.
+
+    This runs at collection time, so it must quietly return nothing when the
+    resources are not available; the fixtures will complain soon enough.
     """
-    return (
+    in_dir = Path('./resources/easy-sentences/NAFin')
+    if not in_dir.is_dir():
+        return []
+    return sorted(
         fn
-        for fn in os.listdir(easy_in_dir)
-        if fn not in easy_expected_failures
+        for fn in os.listdir(in_dir)
+        if fn not in EASY_EXPECTED_FAILURES
     )
 
 
+# The input directory is listed only once, at collection.
+EASY_EXPECTED_SUCCESSES = _list_easy_expected_to_succeed()
+
+
+@pytest.fixture
+def easy_expected_to_succeed():
+    """
+    Names of files of which we expect the integration test to pass.
+
+    Tests that want one case per file should use the parametrized
+    `easy_success_filename` argument instead.
+    """
+    return EASY_EXPECTED_SUCCESSES
+
+
 def pytest_generate_tests(metafunc):
     """
-    Generate a separate test case for every expected failure,
+    Generate a separate test case for every input file, so the cases can run
+    in parallel (e.g. with pytest-xdist) and a failure points at its file.
+
+    For the expected failures a separate case per file is even necessary,
     because otherwise we can't check that all of them fail.
     """
     arg = 'easy_expected_to_fail'
     if arg in metafunc.fixturenames:
         metafunc.parametrize(arg, EASY_EXPECTED_FAILURES)
+    arg = 'easy_success_filename'
+    if arg in metafunc.fixturenames:
+        metafunc.parametrize(arg, EASY_EXPECTED_SUCCESSES)
@@ -1,6 +1,7 @@
 import os
 import sys
 import subprocess
+from collections import deque
 
 from KafNafParserPy import KafNafParser
 
@@ -49,10 +50,11 @@ def run_and_compare(in_filename, out_filename, correct_out_filename,
         # Check something happened and that the result can be parsed
         outnaf = KafNafParser(out_filename)
 
-        # Get the header information to be able to compare raw files
-        our_header_layer = list(
-            outnaf.get_linguisticProcessors()
-        )[-1]
+        # Get the header information to be able to compare raw files.
+        # Only the last layer is needed, so don't keep the rest.
+        our_header_layer = deque(
+            outnaf.get_linguisticProcessors(), maxlen=1
+        ).pop()
         assert our_header_layer.get_layer() == 'coreferences'
 
         processors = list(
@@ -3,10 +3,10 @@ from .run_and_compare import run_integration
 
 
 @pytest.mark.slow
-def test_integration(easy_expected_to_succeed, easy_in_dir,
+def test_integration(easy_success_filename, easy_in_dir,
                      easy_correct_out_dir, temp_file):
-    for filename in easy_expected_to_succeed:
-        run_integration(filename, easy_in_dir, easy_correct_out_dir, temp_file)
+    run_integration(easy_success_filename, easy_in_dir,
+                    easy_correct_out_dir, temp_file)
 
 
 @pytest.mark.xfail(strict=True, error=AssertionError)
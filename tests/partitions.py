@@ -1,4 +1,5 @@
 import itertools as it
+from functools import lru_cache
 
 from hypothesis.strategies import (
     integers,
@@ -35,6 +36,17 @@ def all_partitions(n):
         yield a[:k + 1]
 
 
+@lru_cache(maxsize=None)
+def _all_partitionings(n):
+    """
+    All partitions of the number `n`, materialized once.
+
+    Every draw of `partitions` walks (part of) this sequence, so generating
+    it over and over dominated the cost of the strategy.
+    """
+    return tuple(tuple(p) for p in all_partitions(n))
+
+
 def partition(iterable, partitioning):
     """
     Partition an iterable according to a partitioning.
@@ -100,7 +112,7 @@ def partitions(draw, iterables, min_size=None, max_size=None):
         lambda p: min_size <= len(p) <= max_size,   # matches size constraints,
         it.islice(     # starting the search at `partition_index`
             it.cycle(  # but continuing from the start if nothing was found yet
-                all_partitions(bare_size)),
+                _all_partitionings(bare_size)),
             partition_index,
             None))
     )